@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any, Mapping, Self, Sequence, TypedDict, Unpack
 
 from aiohttp import ClientSession, FormData, TCPConnector
@@ -15,6 +16,16 @@ from .exceptions import ChClientError
 from .http_client import HttpClient
 
 
+@lru_cache(maxsize=256)
+def _column_index(names: tuple[str, ...]) -> dict[str, int]:
+    """Shared name->position map for `Row`, cached per column set.
+
+    Column names are interned at header parse, so repeated queries with the
+    same shape hit the cache and every `Row` lookup compares by pointer first.
+    """
+    return {name: idx for idx, name in enumerate(names)}
+
+
 class QueryOptions(TypedDict, total=False):
     """Options for ClickHouse query execution."""
 
@@ -133,7 +144,7 @@ class AsyncChClient:
             )
             names, _ = await parser.read_header()
 
-            index = {name: idx for idx, name in enumerate(names)}
+            index = _column_index(tuple(names))
             async for values in parser.rows():
                 yield Row(names, values, index=index)
 
@@ -146,7 +157,7 @@ class AsyncChClient:
             else parse_rowbinary_with_names_and_types(payload, server_tz)
         )
 
-        index = {name: idx for idx, name in enumerate(names)}
+        index = _column_index(tuple(names))
         return [Row(names, values, index=index) for values in rows]
 
     async def execute(self, query: str, **kwargs: Unpack[QueryOptions]):
@@ -212,7 +223,7 @@ class AsyncChClient:
         params, data = self._prepare_query(query, **kwargs)
         payload, tz = await self._http_client.read(self._url, params=params, data=data)
         _, _, rows = parse_rowbinary_with_names_and_types(payload, parse_timezone(tz))
-        return [tuple(values) for values in rows]
+        return list(rows)
 
     async def fetchone(self, query: str, **kwargs: Unpack[QueryOptions]) -> Row | None:
         """Execute query and fetch first result row.
@@ -299,10 +310,10 @@ class AsyncChClient:
 
         if isinstance(data[0], dict):
             format_name = "JSONEachRow"
-            body = "\n".join(to_json(row) for row in data)
+            body = "\n".join(map(to_json, data))
         else:
             format_name = "JSONCompactEachRow"
-            body = "\n".join(to_json(list(row)) for row in data)
+            body = "\n".join([to_json(list(row)) for row in data])
 
         await self._http_client.post(
             self._url,
@@ -0,0 +1,8 @@
+"""JSON codec selection: prefer ``orjson`` when installed, else stdlib ``json``."""
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = ("json_loads",)
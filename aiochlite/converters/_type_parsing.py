@@ -1,85 +1,115 @@
-import re
 from functools import lru_cache
-from typing import Final
 from zoneinfo import ZoneInfo
 
-_DATETIME_TZ_RE: Final[re.Pattern[str]] = re.compile(
-    r"DateTime(?:64)?\(\s*(?:\d+\s*,\s*)?'([^']+)'\s*\)",
-    re.IGNORECASE,
-)
-
 
 @lru_cache(maxsize=256)
 def extract_base_type(ch_type: str) -> str:
-    if ch_type.startswith("Nullable("):
-        return extract_base_type(ch_type[9:-1])
-
-    if ch_type.startswith("LowCardinality("):
-        return extract_base_type(ch_type[15:-1])
+    # Index scan over the original string: peeling a wrapper moves the window
+    # bounds, and the single slice happens once at return.
+    start, end = 0, len(ch_type)
+    while True:
+        if ch_type.startswith("Nullable(", start):
+            start += 9
+            end -= 1
+            continue
+        if ch_type.startswith("LowCardinality(", start):
+            start += 15
+            end -= 1
+            continue
+        break
 
-    if "(" in ch_type:
-        return ch_type[: ch_type.index("(")]
+    paren = ch_type.find("(", start, end)
+    if paren != -1:
+        end = paren
 
-    return ch_type
+    return ch_type[start:end]
 
 
 @lru_cache(maxsize=256)
 def unwrap_wrappers(ch_type: str) -> str:
-    unwrapped = ch_type.strip()
+    start, end = 0, len(ch_type)
     while True:
-        if unwrapped.startswith("Nullable(") and unwrapped.endswith(")"):
-            unwrapped = unwrapped[9:-1].strip()
+        while start < end and ch_type[start].isspace():
+            start += 1
+        while end > start and ch_type[end - 1].isspace():
+            end -= 1
+        if end - start > 9 and ch_type[end - 1] == ")" and ch_type.startswith("Nullable(", start):
+            start += 9
+            end -= 1
             continue
-        if unwrapped.startswith("LowCardinality(") and unwrapped.endswith(")"):
-            unwrapped = unwrapped[15:-1].strip()
+        if end - start > 15 and ch_type[end - 1] == ")" and ch_type.startswith("LowCardinality(", start):
+            start += 15
+            end -= 1
             continue
-        return unwrapped
+        return ch_type[start:end]
 
 
-@lru_cache(maxsize=256)
-def split_type_arguments(type_list: str) -> list[str]:
+def _split_no_quotes(type_list: str) -> tuple[str, ...]:
+    # Quote-free input: only paren depth matters, so skip the quote state.
     parts: list[str] = []
-    buf: list[str] = []
     depth = 0
-    in_quote = False
+    start = 0
 
-    def _flush() -> None:
-        part = "".join(buf).strip()
-        if part:
-            parts.append(part)
-        buf.clear()
+    for idx, ch in enumerate(type_list):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            part = type_list[start:idx].strip()
+            if part:
+                parts.append(part)
+            start = idx + 1
+
+    part = type_list[start:].strip()
+    if part:
+        parts.append(part)
+
+    return tuple(parts)
+
+
+def _split_with_quotes(type_list: str) -> tuple[str, ...]:
+    parts: list[str] = []
+    depth = 0
+    in_quote = False
+    start = 0
 
-    for ch in type_list:
+    for idx, ch in enumerate(type_list):
         if in_quote:
-            buf.append(ch)
             if ch == "'":
                 in_quote = False
-            continue
-
-        if ch == "'":
+        elif ch == "'":
             in_quote = True
-            buf.append(ch)
-            continue
-
-        if ch == "(":
+        elif ch == "(":
             depth += 1
-            buf.append(ch)
-            continue
-
-        if ch == ")":
+        elif ch == ")":
             depth -= 1
-            buf.append(ch)
-            continue
+        elif ch == "," and depth == 0:
+            part = type_list[start:idx].strip()
+            if part:
+                parts.append(part)
+            start = idx + 1
 
-        if ch == "," and depth == 0:
-            _flush()
-            continue
+    part = type_list[start:].strip()
+    if part:
+        parts.append(part)
+
+    return tuple(parts)
 
-        buf.append(ch)
 
-    _flush()
+@lru_cache(maxsize=256)
+def split_type_arguments(type_list: str) -> tuple[str, ...]:
+    # Scan for top-level commas only and slice each argument out of the input,
+    # instead of accumulating every character into a buffer and re-joining.
+    # Returns a tuple: the result is cached and shared, so it must be immutable.
+    if "'" in type_list:
+        return _split_with_quotes(type_list)
+
+    if "(" in type_list:
+        return _split_no_quotes(type_list)
 
-    return parts
+    # Flat scalar lists like "UInt8, String": every comma is top level.
+    return tuple(part for part in map(str.strip, type_list.split(",")) if part)
 
 
 @lru_cache(maxsize=64)
@@ -95,8 +125,16 @@ def parse_timezone(name: str | None) -> ZoneInfo | None:
 
 @lru_cache(maxsize=256)
 def extract_timezone(ch_type: str) -> ZoneInfo | None:
-    match = _DATETIME_TZ_RE.search(unwrap_wrappers(ch_type))
-    if not match:
+    unwrapped = unwrap_wrappers(ch_type)
+    if not unwrapped.startswith(("DateTime(", "DateTime64(")):
+        return None
+
+    start = unwrapped.find("'")
+    if start == -1:
+        return None
+
+    end = unwrapped.find("'", start + 1)
+    if end == -1:
         return None
 
-    return parse_timezone(match.group(1))
+    return parse_timezone(unwrapped[start + 1 : end])
@@ -1,17 +1,30 @@
 import ipaddress
-import json
-import re
 import struct
+import sys
 from collections.abc import AsyncIterator, Sequence
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from functools import lru_cache
+from itertools import repeat
 from typing import Any, Callable, Iterable, Protocol
-from uuid import UUID
+from uuid import UUID, SafeUUID
 from zoneinfo import ZoneInfo
 
+from ._json import json_loads
 from ._type_parsing import extract_base_type, extract_timezone, split_type_arguments, unwrap_wrappers
 
+# Prebound Struct methods: struct.unpack_from(fmt, ...) re-resolves the format string in
+# the module-level format cache on every call; a bound Struct.unpack_from skips that.
+_unpack_int8 = struct.Struct("<b").unpack_from
+_unpack_uint16 = struct.Struct("<H").unpack_from
+_unpack_int16 = struct.Struct("<h").unpack_from
+_unpack_uint32 = struct.Struct("<I").unpack_from
+_unpack_int32 = struct.Struct("<i").unpack_from
+_unpack_uint64 = struct.Struct("<Q").unpack_from
+_unpack_int64 = struct.Struct("<q").unpack_from
+_unpack_float32 = struct.Struct("<f").unpack_from
+_unpack_float64 = struct.Struct("<d").unpack_from
+
 
 class _Reader(Protocol):
     def _read(self, size: int) -> memoryview: ...
@@ -27,6 +40,7 @@ class _Reader(Protocol):
     def read_float32(self) -> float: ...
     def read_float64(self) -> float: ...
     def read_varuint(self) -> int: ...
+    def read_bytes(self, size: int) -> bytes: ...
     def read_string(self) -> str: ...
     def skip(self, size: int): ...
 
@@ -57,37 +71,37 @@ class _BinaryReader:
     def read_int8(self) -> int:
         if self._pos + 1 > len(self._data):
             raise ValueError("Unexpected end of data")
-        value = struct.unpack_from("<b", self._data, self._pos)[0]
+        value = _unpack_int8(self._data, self._pos)[0]
         self._pos += 1
         return value
 
     def read_uint16(self) -> int:
-        value = struct.unpack_from("<H", self._data, self._pos)[0]
+        value = _unpack_uint16(self._data, self._pos)[0]
         self._pos += 2
         return value
 
     def read_int16(self) -> int:
-        value = struct.unpack_from("<h", self._data, self._pos)[0]
+        value = _unpack_int16(self._data, self._pos)[0]
         self._pos += 2
         return value
 
     def read_uint32(self) -> int:
-        value = struct.unpack_from("<I", self._data, self._pos)[0]
+        value = _unpack_uint32(self._data, self._pos)[0]
         self._pos += 4
         return value
 
     def read_int32(self) -> int:
-        value = struct.unpack_from("<i", self._data, self._pos)[0]
+        value = _unpack_int32(self._data, self._pos)[0]
         self._pos += 4
         return value
 
     def read_uint64(self) -> int:
-        value = struct.unpack_from("<Q", self._data, self._pos)[0]
+        value = _unpack_uint64(self._data, self._pos)[0]
         self._pos += 8
         return value
 
     def read_int64(self) -> int:
-        value = struct.unpack_from("<q", self._data, self._pos)[0]
+        value = _unpack_int64(self._data, self._pos)[0]
         self._pos += 8
         return value
 
@@ -95,25 +109,42 @@ class _BinaryReader:
         return int.from_bytes(self._read(16), "little", signed=True)
 
     def read_float32(self) -> float:
-        value = struct.unpack_from("<f", self._data, self._pos)[0]
+        value = _unpack_float32(self._data, self._pos)[0]
         self._pos += 4
         return value
 
     def read_float64(self) -> float:
-        value = struct.unpack_from("<d", self._data, self._pos)[0]
+        value = _unpack_float64(self._data, self._pos)[0]
         self._pos += 8
         return value
 
     def read_varuint(self) -> int:
         """Read LEB128 varuint."""
-        shift = 0
-        result = 0
+        data = self._data
+        pos = self._pos
+        if pos >= len(data):
+            raise ValueError("Unexpected end of data")
+
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            # Single-byte fast path: string lengths and counts are almost always < 128.
+            self._pos = pos
+            return byte
+
+        result = byte & 0x7F
+        shift = 7
         while True:
-            byte = self.read_uint8()
+            if pos >= len(data):
+                raise ValueError("Unexpected end of data")
+            byte = data[pos]
+            pos += 1
             result |= (byte & 0x7F) << shift
             if byte < 0x80:
                 break
             shift += 7
+
+        self._pos = pos
         return result
 
     def read_bytes(self, size: int) -> bytes:
@@ -121,7 +152,8 @@ class _BinaryReader:
 
     def read_string(self) -> str:
         length = self.read_varuint()
-        return self._read(length).tobytes().decode("utf-8")
+        # str(mv, "utf-8") decodes straight from the memoryview without a bytes copy.
+        return str(self._read(length), "utf-8")
 
     @property
     def eof(self) -> bool:
@@ -174,20 +206,26 @@ def _decimal_size(precision: int) -> int:
     raise ValueError(f"Unsupported Decimal precision: {precision}")
 
 
-_EPOCH_DATE = date(1970, 1, 1)
+# Ordinal of 1970-01-01: turns a days-since-epoch count into a date with one
+# C-level fromordinal call, skipping the timedelta object and date.__add__.
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 def _datetime_reader(ch_type: str, server_tz: ZoneInfo | None) -> Callable[[_Reader], datetime]:
     explicit_tz = extract_timezone(ch_type)
     # With an explicit timezone the value is timezone-aware; otherwise the wall-clock time is
     # computed in the server timezone but returned as a naive datetime (no tzinfo).
-    tz = explicit_tz or server_tz
-    strip_tz = explicit_tz is None
+    if explicit_tz is not None:
+        # One constructor call per value: the aware datetime is built directly.
+        @lru_cache(maxsize=4096)
+        def _dt(ts: int) -> datetime:
+            return datetime.fromtimestamp(ts, tz=explicit_tz)
 
-    @lru_cache(maxsize=4096)
-    def _dt(ts: int) -> datetime:
-        dt = datetime.fromtimestamp(ts, tz=tz)
-        return dt.replace(tzinfo=None) if strip_tz else dt
+    else:
+
+        @lru_cache(maxsize=4096)
+        def _dt(ts: int) -> datetime:
+            return datetime.fromtimestamp(ts, tz=server_tz).replace(tzinfo=None)
 
     def _read_dt(reader: _Reader) -> datetime:
         return _dt(reader.read_uint32())
@@ -218,6 +256,66 @@ def _time64_reader(ch_type: str) -> Callable[[_Reader], timedelta]:
     return _read_time64
 
 
+def _dt64_micros_fn(
+    tick_divisor: int,
+    micro_multiplier: int,
+    explicit_tz: ZoneInfo | None,
+    server_tz: ZoneInfo | None,
+) -> Callable[[int], datetime]:
+    """Tick converter for scale <= 6: the sub-second part maps 1:1 onto the microsecond
+    field, so a single replace() beats constructing and adding a timedelta (and folds in
+    the tzinfo strip on naive columns)."""
+    if explicit_tz is not None:
+
+        @lru_cache(maxsize=4096)
+        def _dt64(ticks: int) -> datetime:
+            base_seconds, remainder = divmod(ticks, tick_divisor)
+            dt = datetime.fromtimestamp(base_seconds, tz=explicit_tz)
+            return dt.replace(microsecond=remainder * micro_multiplier) if remainder else dt
+
+    else:
+
+        @lru_cache(maxsize=4096)
+        def _dt64(ticks: int) -> datetime:
+            base_seconds, remainder = divmod(ticks, tick_divisor)
+            dt = datetime.fromtimestamp(base_seconds, tz=server_tz)
+            if remainder:
+                return dt.replace(microsecond=remainder * micro_multiplier, tzinfo=None)
+            return dt.replace(tzinfo=None)
+
+    return _dt64
+
+
+def _dt64_timedelta_fn(
+    tick_divisor: int,
+    micro_divisor: int,
+    explicit_tz: ZoneInfo | None,
+    server_tz: ZoneInfo | None,
+) -> Callable[[int], datetime]:
+    """Tick converter for scale > 6: sub-microsecond remainders need fractional division."""
+    if explicit_tz is not None:
+
+        @lru_cache(maxsize=4096)
+        def _dt64(ticks: int) -> datetime:
+            base_seconds, remainder = divmod(ticks, tick_divisor)
+            dt = datetime.fromtimestamp(base_seconds, tz=explicit_tz)
+            if remainder:
+                dt = dt + timedelta(microseconds=remainder / micro_divisor)
+            return dt
+
+    else:
+
+        @lru_cache(maxsize=4096)
+        def _dt64(ticks: int) -> datetime:
+            base_seconds, remainder = divmod(ticks, tick_divisor)
+            dt = datetime.fromtimestamp(base_seconds, tz=server_tz)
+            if remainder:
+                dt = dt + timedelta(microseconds=remainder / micro_divisor)
+            return dt.replace(tzinfo=None)
+
+    return _dt64
+
+
 def _datetime64_reader(ch_type: str, server_tz: ZoneInfo | None) -> Callable[[_Reader], datetime]:
     inner = ch_type[ch_type.index("(") + 1 : ch_type.rindex(")")]
     parts = [p.strip() for p in inner.split(",")]
@@ -225,17 +323,10 @@ def _datetime64_reader(ch_type: str, server_tz: ZoneInfo | None) -> Callable[[_R
     explicit_tz = extract_timezone(ch_type)
     # With an explicit timezone the value is timezone-aware; otherwise the wall-clock time is
     # computed in the server timezone but returned as a naive datetime (no tzinfo).
-    tz = explicit_tz or server_tz
-    strip_tz = explicit_tz is None
-
-    @lru_cache(maxsize=4096)
-    def _dt64(ticks: int) -> datetime:
-        base_seconds, remainder = divmod(ticks, 10**scale)
-        dt = datetime.fromtimestamp(base_seconds, tz=tz)
-        if remainder:
-            micros = remainder * (10 ** (6 - scale)) if scale <= 6 else remainder / (10 ** (scale - 6))
-            dt = dt + timedelta(microseconds=micros)
-        return dt.replace(tzinfo=None) if strip_tz else dt
+    if scale <= 6:
+        _dt64 = _dt64_micros_fn(10**scale, 10 ** (6 - scale), explicit_tz, server_tz)
+    else:
+        _dt64 = _dt64_timedelta_fn(10**scale, 10 ** (scale - 6), explicit_tz, server_tz)
 
     def _read_dt64(reader: _Reader) -> datetime:
         return _dt64(reader.read_int64())
@@ -262,8 +353,7 @@ def _fixedstring_reader(ch_type: str) -> Callable[[_Reader], str]:
     size = int(inner.strip())
 
     def _read_fixedstring(reader: _Reader) -> str:
-        raw = reader._read(size).tobytes()
-        return raw.decode("utf-8", errors="replace").rstrip("\x00")
+        return str(reader._read(size), "utf-8", "replace").rstrip("\x00")
 
     return _read_fixedstring
 
@@ -277,14 +367,44 @@ def _enum_mapping(ch_type: str) -> dict[int, str]:
       Enum8('a' = 1, 'b' = 2)
     """
     inner = ch_type[ch_type.index("(") + 1 : ch_type.rindex(")")]
-    pairs = re.findall(r"'((?:\\.|[^'])*)'\s*=\s*([+-]?\d+)", inner)
-    if not pairs:
-        raise ValueError(f"Invalid Enum definition: {ch_type}")
-
+    length = len(inner)
     mapping: dict[int, str] = {}
-    for raw_name, raw_value in pairs:
-        name = raw_name.replace("\\\\", "\\").replace("\\'", "'")
-        mapping[int(raw_value)] = name
+    pos = 0
+    while True:
+        start = inner.find("'", pos)
+        if start == -1:
+            break
+
+        # Scan the quoted name, collapsing \\ and \' escapes (other backslash
+        # pairs are kept verbatim, as ClickHouse emits them).
+        name_parts: list[str] = []
+        idx = start + 1
+        while idx < length:
+            ch = inner[idx]
+            if ch == "'":
+                break
+            if ch == "\\" and idx + 1 < length:
+                nxt = inner[idx + 1]
+                name_parts.append(nxt if nxt in "\\'" else ch + nxt)
+                idx += 2
+            else:
+                name_parts.append(ch)
+                idx += 1
+        else:
+            raise ValueError(f"Invalid Enum definition: {ch_type}")
+
+        eq = inner.find("=", idx + 1)
+        if eq == -1:
+            raise ValueError(f"Invalid Enum definition: {ch_type}")
+
+        end = inner.find(",", eq + 1)
+        if end == -1:
+            end = length
+        mapping[int(inner[eq + 1 : end])] = "".join(name_parts)
+        pos = end + 1
+
+    if not mapping:
+        raise ValueError(f"Invalid Enum definition: {ch_type}")
 
     return mapping
 
@@ -314,24 +434,63 @@ def _enum_reader(ch_type: str) -> Callable[[_Reader], str]:
 
 def _ipv4_reader(_: str) -> Callable[[_Reader], ipaddress.IPv4Address]:
     def _read_ipv4(reader: _Reader) -> ipaddress.IPv4Address:
-        return ipaddress.IPv4Address(reader.read_uint32())
+        # The wire value is already the packed integer the class stores in _ip;
+        # bypassing __init__ skips its type dispatch and range validation.
+        addr = ipaddress.IPv4Address.__new__(ipaddress.IPv4Address)
+        addr._ip = reader.read_uint32()
+        return addr
 
     return _read_ipv4
 
 
 def _ipv6_reader(_: str) -> Callable[[_Reader], ipaddress.IPv6Address]:
     def _read_ipv6(reader: _Reader) -> ipaddress.IPv6Address:
-        return ipaddress.IPv6Address(reader._read(16).tobytes())
+        addr = ipaddress.IPv6Address.__new__(ipaddress.IPv6Address)
+        addr._ip = int.from_bytes(reader._read(16), "big")
+        addr._scope_id = None
+        return addr
 
     return _read_ipv6
 
 
+# Fixed-width numeric element types that whole Array blocks can be unpacked with.
+_NUMERIC_ARRAY_FORMATS: dict[str, str] = {
+    "UInt8": "B",
+    "Int8": "b",
+    "UInt16": "H",
+    "Int16": "h",
+    "UInt32": "I",
+    "Int32": "i",
+    "UInt64": "Q",
+    "Int64": "q",
+    "Float32": "f",
+    "Float64": "d",
+}
+
+
 def _array_reader(ch_type: str, server_tz: ZoneInfo | None) -> Callable[[_Reader], list[Any]]:
     inner_type = ch_type[6:-1]
+
+    fmt = _NUMERIC_ARRAY_FORMATS.get(inner_type)
+    if fmt is not None:
+        item_size = struct.calcsize(fmt)
+
+        def _read_numeric_array(reader: _Reader) -> list[Any]:
+            # One struct.unpack over the whole element block instead of one
+            # reader call per element.
+            count = reader.read_varuint()
+            if not count:
+                return []
+            return list(struct.unpack(f"<{count}{fmt}", reader._read(item_size * count)))
+
+        return _read_numeric_array
+
     inner = _reader_for_type(inner_type, server_tz)
 
     def _read_array(reader: _Reader) -> list[Any]:
-        return [inner(reader) for _ in range(reader.read_varuint())]
+        # map over repeat() keeps the per-element calls in C instead of running
+        # comprehension bytecode (and discarding the loop variable) per element.
+        return list(map(inner, repeat(reader, reader.read_varuint())))
 
     return _read_array
 
@@ -360,14 +519,22 @@ def _tuple_reader(ch_type: str, server_tz: ZoneInfo | None) -> Callable[[_Reader
     readers = tuple(_reader_for_type(t, server_tz) for t in element_types)
 
     def _read_tuple(reader: _Reader) -> tuple[Any, ...]:
-        return tuple(r(reader) for r in readers)
+        # tuple([...]): the comprehension runs inline, without resuming a generator frame per element.
+        return tuple([r(reader) for r in readers])
 
     return _read_tuple
 
 
 def _uuid_reader(reader: _Reader) -> UUID:
-    raw = reader._read(16).tobytes()
-    return UUID(bytes=raw[:8][::-1] + raw[8:][::-1])
+    # RowBinary carries a UUID as two little-endian 64-bit halves. Assembling the
+    # 128-bit int directly and bypassing UUID.__init__ skips its byte shuffling
+    # and argument validation; UUID is immutable, hence the __setattr__ calls.
+    hi = reader.read_uint64()
+    lo = reader.read_uint64()
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, "int", (hi << 64) | lo)
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)
+    return uuid
 
 
 _PRIMITIVE_READERS: dict[str, Callable[[_Reader], Any]] = {
@@ -378,7 +545,9 @@ _PRIMITIVE_READERS: dict[str, Callable[[_Reader], Any]] = {
     "Int16": lambda r: r.read_int16(),
     "Int32": lambda r: r.read_int32(),
     "Int64": lambda r: r.read_int64(),
-    "JSON": lambda r: json.loads(r.read_string()),
+    # Bytes go straight to the JSON parser; decoding to str first would be a
+    # second pass over the payload (orjson parses UTF-8 bytes natively).
+    "JSON": lambda r: json_loads(r.read_bytes(r.read_varuint())),
     "String": lambda r: r.read_string(),
     "UInt8": lambda r: r.read_uint8(),
     "UInt16": lambda r: r.read_uint16(),
@@ -387,8 +556,8 @@ _PRIMITIVE_READERS: dict[str, Callable[[_Reader], Any]] = {
 }
 
 _COMPLEX_READERS: dict[str, Callable[[str], Callable[[_Reader], Any]]] = {
-    "Date": lambda _: lambda r: _EPOCH_DATE + timedelta(days=r.read_uint16()),
-    "Date32": lambda _: lambda r: _EPOCH_DATE + timedelta(days=r.read_int32()),
+    "Date": lambda _: lambda r: date.fromordinal(_EPOCH_ORDINAL + r.read_uint16()),
+    "Date32": lambda _: lambda r: date.fromordinal(_EPOCH_ORDINAL + r.read_int32()),
     "Time": lambda _: lambda r: timedelta(seconds=r.read_int32()),
     "Time64": _time64_reader,
     "Enum16": _enum_reader,
@@ -443,10 +612,35 @@ def _reader_for_type(ch_type: str, server_tz: ZoneInfo | None = None) -> Callabl
     raise ValueError(f"Unsupported RowBinary type: {ch_type}")
 
 
+@lru_cache(maxsize=256)
+def _readers_for_types(types: tuple[str, ...], server_tz: ZoneInfo | None) -> tuple[Callable[[_Reader], Any], ...]:
+    """Resolve readers for a whole column set at once, cached per query shape."""
+    return tuple(_reader_for_type(tp, server_tz) for tp in types)
+
+
+@lru_cache(maxsize=256)
+def _row_decoder(readers: tuple[Callable[[_Reader], Any], ...]) -> Callable[[_Reader], tuple[Any, ...]]:
+    """Compile a row decoder specialized to one column shape.
+
+    Each reader is bound as a default argument, so decoding a column is a
+    LOAD_FAST + CALL pair with no per-row iteration over the reader tuple.
+    The compiled function is pure per call, so the streaming parser's
+    checkpoint/restore on ``_NeedMoreData`` keeps working.
+    """
+    if not readers:
+        return lambda _reader: ()
+
+    params = ", ".join([f"_r{i}=_readers[{i}]" for i in range(len(readers))])
+    cells = ", ".join([f"_r{i}(reader)" for i in range(len(readers))])
+    namespace: dict[str, Any] = {"_readers": readers}
+    exec(f"def _decode(reader, *, {params}):\n    return ({cells},)", namespace)  # noqa: S102
+    return namespace["_decode"]
+
+
 def parse_rowbinary_with_names_and_types(
     data: bytes,
     server_tz: ZoneInfo | None = None,
-) -> tuple[list[str], list[str], Iterable[list[Any]]]:
+) -> tuple[list[str], list[str], Iterable[tuple[Any, ...]]]:
     """
     Parse RowBinaryWithNamesAndTypes payload and return header and row iterator.
 
@@ -458,17 +652,17 @@ def parse_rowbinary_with_names_and_types(
     Returns:
         names: list of column names
         types: list of ClickHouse types
-        rows: iterable of rows (list of values)
+        rows: iterable of rows (tuple of values)
     """
     reader = _BinaryReader(data)
     column_count = reader.read_varuint()
-    names = [reader.read_string() for _ in range(column_count)]
+    names = [sys.intern(reader.read_string()) for _ in range(column_count)]
     types = [reader.read_string() for _ in range(column_count)]
-    readers = [_reader_for_type(tp, server_tz) for tp in types]
+    decode = _row_decoder(_readers_for_types(tuple(types), server_tz))
 
-    def _rows() -> Iterable[list[Any]]:
+    def _rows() -> Iterable[tuple[Any, ...]]:
         while not reader.eof:
-            yield [read(reader) for read in readers]
+            yield decode(reader)
 
     return names, types, _rows()
 
@@ -653,11 +847,22 @@ def _skipper_for_type(ch_type: str) -> Callable[[_Reader], None]:
     raise ValueError(f"Unsupported RowBinary type: {ch_type}")
 
 
+@lru_cache(maxsize=256)
+def _skippers_for_types(types: tuple[str, ...]) -> tuple[Callable[[_Reader], None], ...]:
+    """Resolve skippers for a whole column set at once, cached per query shape."""
+    return tuple(_skipper_for_type(tp) for tp in types)
+
+
 class RowBinaryLazyValues(Sequence[Any]):
     __slots__ = ("_cache", "_data", "_offsets", "_readers")
     _MISSING = object()
 
-    def __init__(self, data: memoryview, offsets: list[tuple[int, int]], readers: list[Callable[[_Reader], Any]]):
+    def __init__(
+        self,
+        data: memoryview,
+        offsets: list[tuple[int, int]],
+        readers: Sequence[Callable[[_Reader], Any]],
+    ):
         self._data = data
         self._offsets = offsets
         self._readers = readers
@@ -693,10 +898,11 @@ def parse_rowbinary_with_names_and_types_lazy(
     """
     reader = _BinaryReader(data)
     column_count = reader.read_varuint()
-    names = [reader.read_string() for _ in range(column_count)]
+    names = [sys.intern(reader.read_string()) for _ in range(column_count)]
     types = [reader.read_string() for _ in range(column_count)]
-    skippers = [_skipper_for_type(tp) for tp in types]
-    readers = [_reader_for_type(tp, server_tz) for tp in types]
+    types_key = tuple(types)
+    skippers = _skippers_for_types(types_key)
+    readers = _readers_for_types(types_key, server_tz)
     payload = memoryview(data)
 
     def _rows() -> Iterable[RowBinaryLazyValues]:
@@ -780,79 +986,91 @@ class _StreamingReader:
     def read_int8(self) -> int:
         if self._pos + 1 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<b", self._buf, self._pos)[0]
+        value = _unpack_int8(self._buf, self._pos)[0]
         self._pos += 1
         return value
 
     def read_uint16(self) -> int:
         if self._pos + 2 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<H", self._buf, self._pos)[0]
+        value = _unpack_uint16(self._buf, self._pos)[0]
         self._pos += 2
         return value
 
     def read_int16(self) -> int:
         if self._pos + 2 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<h", self._buf, self._pos)[0]
+        value = _unpack_int16(self._buf, self._pos)[0]
         self._pos += 2
         return value
 
     def read_uint32(self) -> int:
         if self._pos + 4 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<I", self._buf, self._pos)[0]
+        value = _unpack_uint32(self._buf, self._pos)[0]
         self._pos += 4
         return value
 
     def read_int32(self) -> int:
         if self._pos + 4 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<i", self._buf, self._pos)[0]
+        value = _unpack_int32(self._buf, self._pos)[0]
         self._pos += 4
         return value
 
     def read_uint64(self) -> int:
         if self._pos + 8 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<Q", self._buf, self._pos)[0]
+        value = _unpack_uint64(self._buf, self._pos)[0]
         self._pos += 8
         return value
 
     def read_int64(self) -> int:
         if self._pos + 8 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<q", self._buf, self._pos)[0]
+        value = _unpack_int64(self._buf, self._pos)[0]
         self._pos += 8
         return value
 
     def read_float32(self) -> float:
         if self._pos + 4 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<f", self._buf, self._pos)[0]
+        value = _unpack_float32(self._buf, self._pos)[0]
         self._pos += 4
         return value
 
     def read_float64(self) -> float:
         if self._pos + 8 > len(self._buf):
             raise _NeedMoreData
-        value = struct.unpack_from("<d", self._buf, self._pos)[0]
+        value = _unpack_float64(self._buf, self._pos)[0]
         self._pos += 8
         return value
 
     def read_varuint(self) -> int:
+        buf = self._buf
         p = self._pos
-        shift = 0
-        result = 0
+        if p >= len(buf):
+            raise _NeedMoreData
+
+        byte = buf[p]
+        p += 1
+        if byte < 0x80:
+            # Single-byte fast path: string lengths and counts are almost always < 128.
+            self._pos = p
+            return byte
+
+        result = byte & 0x7F
+        shift = 7
         while True:
-            if p >= len(self._buf):
+            if p >= len(buf):
                 raise _NeedMoreData
-            byte = self._buf[p]
+            byte = buf[p]
             p += 1
             result |= (byte & 0x7F) << shift
             if byte < 0x80:
                 break
             shift += 7
+
         self._pos = p
         return result
 
@@ -862,7 +1080,7 @@ class _StreamingReader:
         if self._pos + length > len(self._buf):
             self._pos = p
             raise _NeedMoreData
-        s = bytes(self._buf[self._pos : self._pos + length]).decode("utf-8")
+        s = str(self._buf[self._pos : self._pos + length], "utf-8")
         self._pos += length
         return s
 
@@ -874,8 +1092,9 @@ class RowBinaryWithNamesAndTypesStreamParser:
         self._done = False
         self._names: list[str] | None = None
         self._types: list[str] | None = None
-        self._readers: list[Callable[[_Reader], Any]] | None = None
-        self._skippers: list[Callable[[_Reader], None]] | None = None
+        self._readers: tuple[Callable[[_Reader], Any], ...] | None = None
+        self._skippers: tuple[Callable[[_Reader], None], ...] | None = None
+        self._decode: Callable[[_Reader], tuple[Any, ...]] | None = None
         self._lazy = lazy
         self._server_tz = server_tz
 
@@ -896,15 +1115,17 @@ class RowBinaryWithNamesAndTypesStreamParser:
             checkpoint = self._reader.pos
             try:
                 column_count = self._reader.read_varuint()
-                names = [self._reader.read_string() for _ in range(column_count)]
+                names = [sys.intern(self._reader.read_string()) for _ in range(column_count)]
                 types = [self._reader.read_string() for _ in range(column_count)]
                 self._names = names
                 self._types = types
-                self._readers = [_reader_for_type(tp, self._server_tz) for tp in types]
+                types_key = tuple(types)
+                self._readers = _readers_for_types(types_key, self._server_tz)
                 if self._lazy:
-                    self._skippers = [_skipper_for_type(tp) for tp in types]
+                    self._skippers = _skippers_for_types(types_key)
                 else:
                     self._skippers = None
+                    self._decode = _row_decoder(self._readers)
             except _NeedMoreData:
                 self._reader.pos = checkpoint
                 if not await self._fill():
@@ -912,35 +1133,60 @@ class RowBinaryWithNamesAndTypesStreamParser:
             else:
                 return names, types
 
-    async def rows(self) -> AsyncIterator[list[Any] | RowBinaryLazyValues]:
+    def rows(self) -> AsyncIterator[tuple[Any, ...] | RowBinaryLazyValues]:
+        return self._lazy_rows() if self._lazy else self._eager_rows()
+
+    async def _eager_rows(self) -> AsyncIterator[tuple[Any, ...]]:
         await self.read_header()
-        assert self._readers is not None
+        decode = self._decode
+        assert decode is not None
+        # Locals instead of attribute loads in the per-row loop.
+        reader = self._reader
 
         while True:
-            if self._done and self._reader.remaining == 0:
+            if self._done and reader.remaining == 0:
                 return
 
-            checkpoint = self._reader.pos
+            checkpoint = reader.pos
             try:
-                if self._lazy:
-                    assert self._skippers is not None
-                    row_start = self._reader.pos
-                    offsets: list[tuple[int, int]] = []
-                    for skip in self._skippers:
-                        cell_start = self._reader.pos
-                        skip(self._reader)
-                        cell_end = self._reader.pos
-                        offsets.append((cell_start - row_start, cell_end - row_start))
-                    row_end = self._reader.pos
-                    row_bytes = self._reader.copy_slice(row_start, row_end)
-                    yield RowBinaryLazyValues(memoryview(row_bytes), offsets, self._readers)
-                else:
-                    values = [read(self._reader) for read in self._readers]
-                    yield values
-                self._reader.compact()
+                values = decode(reader)
             except _NeedMoreData:
-                self._reader.pos = checkpoint
+                reader.pos = checkpoint
+                if not await self._fill():
+                    if reader.remaining == 0:
+                        return
+                    raise ValueError("Unexpected end of data") from None
+            else:
+                yield values
+                reader.compact()
+
+    async def _lazy_rows(self) -> AsyncIterator[RowBinaryLazyValues]:
+        await self.read_header()
+        readers = self._readers
+        skippers = self._skippers
+        assert readers is not None
+        assert skippers is not None
+        # Locals instead of attribute loads in the per-row loop.
+        reader = self._reader
+
+        while True:
+            if self._done and reader.remaining == 0:
+                return
+
+            row_start = reader.pos
+            try:
+                offsets: list[tuple[int, int]] = []
+                for skip in skippers:
+                    cell_start = reader.pos
+                    skip(reader)
+                    offsets.append((cell_start - row_start, reader.pos - row_start))
+                row_bytes = reader.copy_slice(row_start, reader.pos)
+            except _NeedMoreData:
+                reader.pos = row_start
                 if not await self._fill():
-                    if self._reader.remaining == 0:
+                    if reader.remaining == 0:
                         return
                     raise ValueError("Unexpected end of data") from None
+            else:
+                yield RowBinaryLazyValues(memoryview(row_bytes), offsets, readers)
+                reader.compact()
@@ -1,9 +1,19 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID
 
 
+def format_datetime(value: datetime) -> str:
+    # Fixed-format "YYYY-MM-DD HH:MM:SS": f-string field formatting avoids re-interpreting
+    # a strftime format string (and its locale machinery) on every value.
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d} {value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+
+
+def format_date(value: date) -> str:
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
 def format_timedelta(td: timedelta) -> str:
     total_us = td.days * 86_400_000_000 + td.seconds * 1_000_000 + td.microseconds
     sign = "-" if total_us < 0 else ""
@@ -37,56 +47,100 @@ def _escape_ch_string_literal(value: str) -> str:
     )
 
 
+# Exact-type dispatch: one dict lookup on type(value) instead of an isinstance ladder.
+# Subclasses miss the table on purpose and go through the isinstance fallbacks below.
+_SCALAR_LITERAL_HANDLERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: lambda value: f"'{_escape_ch_string_literal(value)}'",
+    datetime: lambda value: f"'{format_datetime(value)}'",
+    date: lambda value: f"'{format_date(value)}'",
+    timedelta: lambda value: f"'{format_timedelta(value)}'",
+    UUID: lambda value: f"'{value}'",
+    Decimal: lambda value: f"'{value}'",
+    bytes: lambda value: f"'{_escape_ch_string_literal(value.decode('utf-8'))}'",
+}
+
+
 def _scalar_clickhouse_literal(value: Any) -> str | _MissingType:
     if value is None:
-        out: str | _MissingType = "NULL"
+        return "NULL"
+
+    handler = _SCALAR_LITERAL_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    if isinstance(value, datetime):
+        out: str | _MissingType = f"'{format_datetime(value)}'"
+    elif isinstance(value, date):
+        out = f"'{format_date(value)}'"
+    elif isinstance(value, timedelta):
+        out = f"'{format_timedelta(value)}'"
+    elif isinstance(value, (UUID, Decimal)):
+        out = f"'{value}'"
+    elif isinstance(value, bytes):
+        out = f"'{_escape_ch_string_literal(value.decode('utf-8'))}'"
     else:
-        value_type = type(value)
-        if value_type is bool:
-            out = "true" if value else "false"
-        elif value_type is int or value_type is float:
-            out = str(value)
-        elif value_type is str:
-            out = f"'{_escape_ch_string_literal(value)}'"
-        elif isinstance(value, datetime):
-            out = f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
-        elif isinstance(value, date):
-            out = f"'{value.strftime('%Y-%m-%d')}'"
-        elif isinstance(value, timedelta):
-            out = f"'{format_timedelta(value)}'"
-        elif isinstance(value, (UUID, Decimal)):
-            out = f"'{value}'"
-        elif isinstance(value, bytes):
-            out = f"'{_escape_ch_string_literal(value.decode('utf-8'))}'"
-        else:
-            out = _MISSING
+        out = _MISSING
 
     return out
 
 
-def _container_clickhouse_literal(value: Any) -> str | _MissingType:
-    if isinstance(value, tuple):
-        return f"({','.join(_to_clickhouse_literal(item) for item in value)})"
-    if isinstance(value, list):
-        return f"[{','.join(_to_clickhouse_literal(item) for item in value)}]"
-    if isinstance(value, dict):
-        items = ",".join(f"{_to_clickhouse_literal(str(k))}:{_to_clickhouse_literal(v)}" for k, v in value.items())
-        return f"{{{items}}}"
+def _emit_clickhouse_sequence(value: Any, out: list[str], open_char: str, close_char: str) -> None:
+    out.append(open_char)
+    for idx, item in enumerate(value):
+        if idx:
+            out.append(",")
+        _emit_clickhouse_literal(item, out)
+    out.append(close_char)
 
-    return _MISSING
 
-
-def _to_clickhouse_literal(value: Any) -> str:
-    """Render Python value as a ClickHouse literal (used for container params)."""
+def _emit_clickhouse_literal(value: Any, out: list[str]) -> None:
+    # Single walk over nested containers: every piece lands in one shared list that is
+    # joined exactly once at the top, instead of building a string per nesting level.
     scalar = _scalar_clickhouse_literal(value)
     if not isinstance(scalar, _MissingType):
-        return scalar
+        out.append(scalar)
+    elif isinstance(value, tuple):
+        _emit_clickhouse_sequence(value, out, "(", ")")
+    elif isinstance(value, list):
+        _emit_clickhouse_sequence(value, out, "[", "]")
+    elif isinstance(value, dict):
+        out.append("{")
+        for idx, (key, item) in enumerate(value.items()):
+            if idx:
+                out.append(",")
+            _emit_clickhouse_literal(str(key), out)
+            out.append(":")
+            _emit_clickhouse_literal(item, out)
+        out.append("}")
+    else:
+        out.append(f"'{_escape_ch_string_literal(str(value))}'")
 
-    container = _container_clickhouse_literal(value)
-    if not isinstance(container, _MissingType):
-        return container
 
-    return f"'{_escape_ch_string_literal(str(value))}'"
+def _to_clickhouse_literal(value: Any) -> str:
+    """Render Python value as a ClickHouse literal (used for container params)."""
+    out: list[str] = []
+    _emit_clickhouse_literal(value, out)
+    return "".join(out)
+
+
+_PARAM_HANDLERS: dict[type, Callable[[Any], str | int | float]] = {
+    bool: lambda value: 1 if value else 0,
+    int: lambda value: value,
+    float: lambda value: value,
+    str: lambda value: value,
+    list: _to_clickhouse_literal,
+    tuple: _to_clickhouse_literal,
+    dict: _to_clickhouse_literal,
+    datetime: format_datetime,
+    date: format_date,
+    timedelta: format_timedelta,
+    UUID: str,
+    Decimal: str,
+    bytes: lambda value: value.decode("utf-8"),
+}
 
 
 def to_clickhouse(value: Any) -> str | int | float:
@@ -100,26 +154,25 @@ def to_clickhouse(value: Any) -> str | int | float:
         str | int | float: Converted value suitable for ClickHouse.
     """
     if value is None:
-        out: str | int | float = "\\N"
+        return "\\N"
+
+    handler = _PARAM_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    if isinstance(value, (list, tuple, dict)):
+        out: str | int | float = _to_clickhouse_literal(value)
+    elif isinstance(value, datetime):
+        out = format_datetime(value)
+    elif isinstance(value, date):
+        out = format_date(value)
+    elif isinstance(value, timedelta):
+        out = format_timedelta(value)
+    elif isinstance(value, (UUID, Decimal)):
+        out = str(value)
+    elif isinstance(value, bytes):
+        out = value.decode("utf-8")
     else:
-        value_type = type(value)
-        if value_type is bool:
-            out = 1 if value else 0
-        elif value_type is int or value_type is float or value_type is str:
-            out = value
-        elif isinstance(value, (list, tuple, dict)):
-            out = _to_clickhouse_literal(value)
-        elif isinstance(value, datetime):
-            out = value.strftime("%Y-%m-%d %H:%M:%S")
-        elif isinstance(value, date):
-            out = value.strftime("%Y-%m-%d")
-        elif isinstance(value, timedelta):
-            out = format_timedelta(value)
-        elif isinstance(value, (UUID, Decimal)):
-            out = str(value)
-        elif isinstance(value, bytes):
-            out = value.decode("utf-8")
-        else:
-            out = str(value)
+        out = str(value)
 
     return out
@@ -1,26 +1,61 @@
 import json
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID
 
-from .to_clickhouse import format_timedelta
+from .to_clickhouse import format_date, format_datetime, format_timedelta
+
+# Exact-type dispatch: one dict lookup on type(value) instead of an isinstance ladder.
+_JSON_DEFAULT_HANDLERS: dict[type, Callable[[Any], str]] = {
+    datetime: format_datetime,
+    date: format_date,
+    timedelta: format_timedelta,
+    UUID: str,
+    Decimal: str,
+    bytes: lambda value: value.decode("utf-8"),
+}
 
 
 def _json_default(value: Any) -> str:
-    if isinstance(value, datetime):
-        return value.strftime("%Y-%m-%d %H:%M:%S")
-    if isinstance(value, date):
-        return value.strftime("%Y-%m-%d")
-    if isinstance(value, timedelta):
-        return format_timedelta(value)
-    if isinstance(value, (UUID, Decimal)):
-        return str(value)
-    if isinstance(value, bytes):
-        return value.decode("utf-8")
-    return str(value)
-
-
-def to_json(data: Any) -> str:
-    """Convert Python data to JSON string for ClickHouse HTTP API."""
+    handler = _JSON_DEFAULT_HANDLERS.get(type(value))
+    if handler is None:
+        # Subclasses miss the exact-type table; scan it in declaration order
+        # (datetime before date) as the isinstance fallback.
+        for base, base_handler in _JSON_DEFAULT_HANDLERS.items():
+            if isinstance(value, base):
+                handler = base_handler
+                break
+        else:
+            return str(value)
+
+    return handler(value)
+
+
+def _stdlib_to_json(data: Any) -> str:
     return json.dumps(data, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+try:
+    from orjson import OPT_NON_STR_KEYS, OPT_PASSTHROUGH_DATETIME
+    from orjson import dumps as _orjson_dumps
+
+    _ORJSON_OPTIONS = OPT_PASSTHROUGH_DATETIME | OPT_NON_STR_KEYS
+
+    def to_json(data: Any) -> str:
+        """Convert Python data to JSON string for ClickHouse HTTP API."""
+        # OPT_PASSTHROUGH_DATETIME routes datetime/date through _json_default so the
+        # ClickHouse "YYYY-MM-DD HH:MM:SS" rendering is kept instead of RFC 3339.
+        try:
+            return _orjson_dumps(data, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers outside the 64-bit range without routing
+            # them through `default`; stdlib json serializes them (e.g. Int128
+            # / UInt256 inserts), so keep it as the slow path.
+            return _stdlib_to_json(data)
+
+except ImportError:
+
+    def to_json(data: Any) -> str:
+        """Convert Python data to JSON string for ClickHouse HTTP API."""
+        return _stdlib_to_json(data)
@@ -16,7 +16,7 @@ def _to_json_compact_each_row_bytes(external_table: ExternalTable) -> bytes:
     if isinstance(rows[0], dict):
         rows = _transform_to_json_compact_each_row([s[0] for s in external_table.structure], rows)
 
-    data = "\n".join(to_json(list(r)) for r in rows) + "\n"
+    data = "\n".join([to_json(list(r)) for r in rows]) + "\n"
     return data.encode("utf-8")
 
 
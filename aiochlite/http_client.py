@@ -38,12 +38,9 @@ class HttpClient:
     ) -> AsyncGenerator[tuple[str | None, AsyncIterator[bytes]], None]:
         async with self._session.post(url, params=params, data=data) as response:
             await _check_response(response)
-
-            async def _chunks() -> AsyncIterator[bytes]:
-                async for chunk in response.content.iter_chunked(262_144):
-                    yield chunk
-
-            yield response.headers.get(_TIMEZONE_HEADER), _chunks()
+            # iter_any hands over each received buffer as-is instead of
+            # re-slicing the stream into fixed-size chunks.
+            yield response.headers.get(_TIMEZONE_HEADER), response.content.iter_any()
 
     async def close(self):
         await self._session.close()
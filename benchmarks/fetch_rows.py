@@ -19,15 +19,15 @@ import gc
 import os
 import time
 from collections.abc import Sequence
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Any, AsyncIterator, Protocol
+from typing import Any, AsyncIterator, Callable, Iterator, Protocol
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 import aiochclient
 import clickhouse_connect
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 
 import aiochlite
 
@@ -41,11 +41,38 @@ BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", default="3"))
 BENCH_WARMUP = int(os.getenv("BENCH_WARMUP", default="1"))
 
 
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # One collect/freeze/disable around all rounds: freezing parks pre-benchmark
+    # objects outside the young generations, and pausing once avoids the
+    # per-round enable/disable churn.
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.unfreeze()
+
+
 def _get_url():
     scheme = "https" if CLICKHOUSE_PORT == 8443 else "http"
     return f"{scheme}://{CLICKHOUSE_HOST}:{CLICKHOUSE_PORT}"
 
 
+def _make_client() -> aiochlite.AsyncChClient:
+    # Long keepalive so every round reuses the same warm connection instead of
+    # re-handshaking mid-benchmark.
+    return aiochlite.AsyncChClient(
+        url=_get_url(),
+        user=CLICKHOUSE_USER,
+        password=CLICKHOUSE_PASSWORD,
+        lazy_decode=False,
+        session=ClientSession(connector=TCPConnector(keepalive_timeout=300)),
+    )
+
+
 async def _setup_table(client: aiochlite.AsyncChClient, table: str) -> None:
     await client.execute(
         f"""
@@ -80,28 +107,48 @@ class _RowLike(Protocol):
     def __getitem__(self, key: str) -> Any: ...
 
 
-def _epoch_seconds(value: datetime) -> int:
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=ZoneInfo("UTC"))
-    return int(value.timestamp())
+_UTC = ZoneInfo("UTC")
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+
+
+def _epoch_seconds_aware(value: datetime) -> int:
+    # Datetime subtraction stays in C; .timestamp() detours through the local
+    # timezone machinery and would distort the measured decode cost.
+    return int((value - _EPOCH).total_seconds())
+
+
+def _epoch_seconds_naive(value: datetime) -> int:
+    return int((value.replace(tzinfo=_UTC) - _EPOCH).total_seconds())
+
+
+def _epoch_seconds_fn(value: datetime) -> Callable[[datetime], int]:
+    # A column is uniformly aware or naive; decide once per result set instead
+    # of re-testing tzinfo on every value.
+    return _epoch_seconds_naive if value.tzinfo is None else _epoch_seconds_aware
 
 
 def _checksum(rows: Sequence[_RowLike]) -> int:
+    if not rows:
+        return 0
+    epoch_seconds = _epoch_seconds_fn(rows[0]["event_time"])
     total = 0
     for row in rows:
         total += int(row["id"])
         total += int(row["payload"][1])
-        total += _epoch_seconds(row["event_time"])
+        total += epoch_seconds(row["event_time"])
         total += int(row["prices"][0] * 100)
     return total
 
 
 def _checksum_tuple_rows(rows: Sequence[Sequence[Any]]) -> int:
+    if not rows:
+        return 0
+    epoch_seconds = _epoch_seconds_fn(rows[0][1])
     total = 0
     for id_, event_time, payload, prices in rows:
         total += int(id_)
         total += int(payload[1])
-        total += _epoch_seconds(event_time)
+        total += epoch_seconds(event_time)
         total += int(prices[0] * 100)
     return total
 
@@ -116,25 +163,22 @@ def _print_rounds(label: str, rows: int, durations: list[float]) -> None:
 
 
 async def _bench_aiochlite_rows(table: str) -> None:
-    client = aiochlite.AsyncChClient(
-        url=_get_url(), user=CLICKHOUSE_USER, password=CLICKHOUSE_PASSWORD, lazy_decode=False
-    )
+    client = _make_client()
     try:
         query = f"SELECT id, event_time, payload, prices FROM {table} ORDER BY id"
         for _ in range(BENCH_WARMUP):
             _checksum(await client.fetch(query))
 
         durations: list[float] = []
-        for _ in range(BENCH_ROUNDS):
-            gc.collect()
-            gc.disable()
-            t0 = time.perf_counter()
-            chk = _checksum(await client.fetch(query))
-            dur = time.perf_counter() - t0
-            gc.enable()
-            if chk == -1:
-                raise RuntimeError("Impossible checksum")
-            durations.append(dur)
+        with _gc_paused():
+            for _ in range(BENCH_ROUNDS):
+                t0 = time.perf_counter()
+                fetched = await client.fetch(query)
+                dur = time.perf_counter() - t0
+                chk = _checksum(fetched)
+                if chk == -1:
+                    raise RuntimeError("Impossible checksum")
+                durations.append(dur)
     finally:
         await client.close()
 
@@ -142,31 +186,63 @@ async def _bench_aiochlite_rows(table: str) -> None:
 
 
 async def _bench_aiochlite_tuples(table: str) -> None:
-    client = aiochlite.AsyncChClient(
-        url=_get_url(), user=CLICKHOUSE_USER, password=CLICKHOUSE_PASSWORD, lazy_decode=False
-    )
+    client = _make_client()
     try:
         query = f"SELECT id, event_time, payload, prices FROM {table} ORDER BY id"
         for _ in range(BENCH_WARMUP):
             _checksum_tuple_rows(await client.fetch_rows(query))
 
         durations: list[float] = []
-        for _ in range(BENCH_ROUNDS):
-            gc.collect()
-            gc.disable()
-            t0 = time.perf_counter()
-            chk = _checksum_tuple_rows(await client.fetch_rows(query))
-            dur = time.perf_counter() - t0
-            gc.enable()
-            if chk == -1:
-                raise RuntimeError("Impossible checksum")
-            durations.append(dur)
+        with _gc_paused():
+            for _ in range(BENCH_ROUNDS):
+                t0 = time.perf_counter()
+                fetched = await client.fetch_rows(query)
+                dur = time.perf_counter() - t0
+                chk = _checksum_tuple_rows(fetched)
+                if chk == -1:
+                    raise RuntimeError("Impossible checksum")
+                durations.append(dur)
     finally:
         await client.close()
 
     _print_rounds("aiochlite (tuples)", BENCH_ROWS, durations)
 
 
+async def _bench_aiochlite_stream(table: str) -> None:
+    client = _make_client()
+    try:
+        query = f"SELECT id, event_time, payload, prices FROM {table} ORDER BY id"
+
+        async def _stream_checksum() -> int:
+            total = 0
+            epoch_seconds: Callable[[datetime], int] | None = None
+            async for id_, event_time, payload, prices in client.stream_rows(query):
+                if epoch_seconds is None:
+                    epoch_seconds = _epoch_seconds_fn(event_time)
+                total += int(id_)
+                total += int(payload[1])
+                total += epoch_seconds(event_time)
+                total += int(prices[0] * 100)
+            return total
+
+        for _ in range(BENCH_WARMUP):
+            await _stream_checksum()
+
+        durations: list[float] = []
+        with _gc_paused():
+            for _ in range(BENCH_ROUNDS):
+                t0 = time.perf_counter()
+                chk = await _stream_checksum()
+                dur = time.perf_counter() - t0
+                if chk == -1:
+                    raise RuntimeError("Impossible checksum")
+                durations.append(dur)
+    finally:
+        await client.close()
+
+    _print_rounds("aiochlite (stream)", BENCH_ROWS, durations)
+
+
 async def _bench_aiochclient(table: str) -> None:
     query = f"SELECT id, event_time, payload, prices FROM {table} ORDER BY id"
 
@@ -177,16 +253,15 @@ async def _bench_aiochclient(table: str) -> None:
         for _ in range(BENCH_WARMUP):
             _checksum(await client.fetch(query))
 
-        for _ in range(BENCH_ROUNDS):
-            gc.collect()
-            gc.disable()
-            t0 = time.perf_counter()
-            chk = _checksum(await client.fetch(query))
-            dur = time.perf_counter() - t0
-            gc.enable()
-            if chk == -1:
-                raise RuntimeError("Impossible checksum")
-            durations.append(dur)
+        with _gc_paused():
+            for _ in range(BENCH_ROUNDS):
+                t0 = time.perf_counter()
+                fetched = await client.fetch(query)
+                dur = time.perf_counter() - t0
+                chk = _checksum(fetched)
+                if chk == -1:
+                    raise RuntimeError("Impossible checksum")
+                durations.append(dur)
 
     _print_rounds("aiochclient", BENCH_ROWS, durations)
 
@@ -209,17 +284,16 @@ async def _bench_clickhouse_connect(table: str) -> None:
             _checksum_tuple_rows(result.result_rows)
 
         durations: list[float] = []
-        for _ in range(BENCH_ROUNDS):
-            gc.collect()
-            gc.disable()
-            t0 = time.perf_counter()
-            result = await client.query(query)
-            chk = _checksum_tuple_rows(result.result_rows)
-            dur = time.perf_counter() - t0
-            gc.enable()
-            if chk == -1:
-                raise RuntimeError("Impossible checksum")
-            durations.append(dur)
+        with _gc_paused():
+            for _ in range(BENCH_ROUNDS):
+                t0 = time.perf_counter()
+                result = await client.query(query)
+                rows = result.result_rows
+                dur = time.perf_counter() - t0
+                chk = _checksum_tuple_rows(rows)
+                if chk == -1:
+                    raise RuntimeError("Impossible checksum")
+                durations.append(dur)
     finally:
         await client.close()
 
@@ -228,7 +302,7 @@ async def _bench_clickhouse_connect(table: str) -> None:
 
 @asynccontextmanager
 async def create_table() -> AsyncIterator[str]:
-    client = aiochlite.AsyncChClient(url=_get_url(), user=CLICKHOUSE_USER, password=CLICKHOUSE_PASSWORD)
+    client = _make_client()
     table = f"bench_io_{uuid4().hex}"
     print(f"Rows: {BENCH_ROWS}, rounds: {BENCH_ROUNDS}, warmup: {BENCH_WARMUP}")
     print(f"Table: {table}")
@@ -245,6 +319,7 @@ async def main() -> None:
         await _bench_clickhouse_connect(table)
         await _bench_aiochlite_rows(table)
         await _bench_aiochlite_tuples(table)
+        await _bench_aiochlite_stream(table)
         await _bench_aiochclient(table)
 
 
@@ -1,12 +1,9 @@
-import os
-
 import pytest
 
-_INTEGRATION_MARKER = f"tests{os.sep}integration{os.sep}"
-
 
 def _is_integration(nodeid: str) -> bool:
-    return _INTEGRATION_MARKER in nodeid.replace("/", os.sep)
+    # Node ids always use forward slashes, on every platform.
+    return "tests/integration/" in nodeid
 
 
 def _state(session: pytest.Session) -> dict[str, bool]:
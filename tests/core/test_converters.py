@@ -74,6 +74,14 @@ class TestToJson:
         result = to_json([1, 2, 3])
         assert result == "[1,2,3]"
 
+    def test_int_beyond_64_bits(self):
+        """Test integers outside the 64-bit range (Int128/UInt256 columns)."""
+        data = {"big": 2**100, "neg": -(2**70)}
+        result = to_json(data)
+        parsed = json.loads(result)
+        assert parsed["big"] == 2**100
+        assert parsed["neg"] == -(2**70)
+
     def test_datetime_in_dict(self):
         """Test datetime conversion in dictionary."""
         data = {"created_at": datetime(2025, 12, 14, 15, 30, 45)}
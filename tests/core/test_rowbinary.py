@@ -1,5 +1,6 @@
 import asyncio
 import ipaddress
+import struct
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
@@ -47,7 +48,7 @@ def test_parse_rowbinary_simple_types():
 
     assert names == ["id", "name"]
     assert types == ["UInt8", "String"]
-    assert list(rows) == [[1, "alice"], [2, "bob"]]
+    assert list(rows) == [(1, "alice"), (2, "bob")]
 
 
 def test_parse_rowbinary_lazy_only_decodes_accessed_fields():
@@ -97,7 +98,7 @@ def test_streaming_rowbinary_parser_splits_chunks():
     names, types, rows = asyncio.run(_run())
     assert names == ["id", "name"]
     assert types == ["UInt8", "String"]
-    assert rows == [[1, "alice"], [2, "bob"]]
+    assert rows == [(1, "alice"), (2, "bob")]
 
 
 def test_parse_rowbinary_date_and_decimal():
@@ -116,7 +117,7 @@ def test_parse_rowbinary_date_and_decimal():
     parsed = list(rows)
 
     assert names == ["d", "price"]
-    assert parsed == [[date(2025, 12, 14), Decimal("123.45")]]
+    assert parsed == [(date(2025, 12, 14), Decimal("123.45"))]
 
 
 def test_parse_rowbinary_datetime64_array_uuid():
@@ -147,6 +148,27 @@ def test_parse_rowbinary_datetime64_array_uuid():
     assert parsed[0][2] == UUID(int=1)
 
 
+def test_parse_rowbinary_numeric_arrays_bulk_decode():
+    parts = [
+        _encode_varuint(2),
+        _encode_string("ints"),
+        _encode_string("floats"),
+        _encode_string("Array(Int64)"),
+        _encode_string("Array(Float64)"),
+        _encode_varuint(3),
+        struct.pack("<3q", -1, 0, 2**62),
+        _encode_varuint(2),
+        struct.pack("<2d", 0.5, -2.25),
+        _encode_varuint(0),  # empty Array(Int64)
+        _encode_varuint(0),  # empty Array(Float64)
+    ]
+
+    _names, types, rows = parse_rowbinary_with_names_and_types(b"".join(parts))
+
+    assert types == ["Array(Int64)", "Array(Float64)"]
+    assert list(rows) == [([-1, 0, 2**62], [0.5, -2.25]), ([], [])]
+
+
 def test_parse_rowbinary_datetime_server_timezone_fallback():
     server_tz = ZoneInfo("Europe/Moscow")
     ts = int(datetime(2025, 12, 14, 10, 0, 0, tzinfo=ZoneInfo("UTC")).timestamp())
@@ -255,7 +277,7 @@ def test_parse_rowbinary_map():
 
     assert names == ["m"]
     assert types == ["Map(String, Int32)"]
-    assert parsed == [[{"a": 1, "b": -2}]]
+    assert parsed == [({"a": 1, "b": -2},)]
 
 
 def test_parse_rowbinary_lowcardinality_wrapper():
@@ -277,7 +299,7 @@ def test_parse_rowbinary_lowcardinality_wrapper():
 
     assert names == ["s", "n"]
     assert types == ["LowCardinality(String)", "LowCardinality(Nullable(Int32))"]
-    assert parsed == [["x", 123], ["y", None]]
+    assert parsed == [("x", 123), ("y", None)]
 
 
 def test_parse_rowbinary_fixedstring_and_enums():
@@ -299,7 +321,21 @@ def test_parse_rowbinary_fixedstring_and_enums():
 
     assert names == ["fs", "e8", "e16"]
     assert types == ["FixedString(4)", "Enum8('a' = 1, 'b' = 2)", "Enum16('x' = -1, 'y' = 10)"]
-    assert parsed == [["ab", "b", "x"]]
+    assert parsed == [("ab", "b", "x")]
+
+
+def test_parse_rowbinary_enum_with_escaped_quotes():
+    parts = [
+        _encode_varuint(1),
+        _encode_string("e"),
+        _encode_string(r"Enum8('it\'s' = 1, 'a\\b' = 2)"),
+        (1).to_bytes(1, "little", signed=True),
+        (2).to_bytes(1, "little", signed=True),
+    ]
+
+    _names, _types, rows = parse_rowbinary_with_names_and_types(b"".join(parts))
+
+    assert list(rows) == [("it's",), ("a\\b",)]
 
 
 def test_parse_rowbinary_ip_types():
@@ -321,7 +357,7 @@ def test_parse_rowbinary_ip_types():
 
     assert names == ["ip4", "ip6"]
     assert types == ["IPv4", "IPv6"]
-    assert parsed == [[ipv4, ipv6]]
+    assert parsed == [(ipv4, ipv6)]
 
 
 def test_parse_rowbinary_json_type_as_string():
@@ -337,4 +373,4 @@ def test_parse_rowbinary_json_type_as_string():
 
     assert names == ["doc"]
     assert types == ["JSON"]
-    assert parsed == [[{"a": 1, "b": [True, None]}]]
+    assert parsed == [({"a": 1, "b": [True, None]},)]
@@ -9,3 +9,7 @@ class ChConfig(TypedDict):
 
 class TableFactory(Protocol):
     def __call__(self, **schema: str) -> Awaitable[str]: ...
+
+
+class TablesFactory(Protocol):
+    def __call__(self, *schemas: dict[str, str]) -> Awaitable[list[str]]: ...
@@ -1,17 +1,26 @@
+import asyncio
 import os
-from typing import AsyncIterator
+from itertools import count
+from typing import AsyncIterator, Iterator
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, TCPConnector
 
 from aiochlite import AsyncChClient
 
-from ._types import ChConfig, TableFactory
+from ._types import ChConfig, TableFactory, TablesFactory
 
 CLICKHOUSE_URL = os.getenv("CLICKHOUSE_URL", "http://localhost:8123")
 CLICKHOUSE_USER = os.getenv("CLICKHOUSE_USER", "default")
 CLICKHOUSE_PASSWORD = os.getenv("CLICKHOUSE_PASSWORD", "")
 
+# One random prefix per session keeps names unique across concurrent CI runs;
+# within the session a plain counter is enough and avoids a uuid4 per table.
+_TABLE_PREFIX = f"test_aiochlite_{uuid4().hex[:12]}"
+_table_seq = count()
+
 
 @pytest.fixture(scope="session")
 def clickhouse_config() -> ChConfig:
@@ -22,38 +31,106 @@ def clickhouse_config() -> ChConfig:
     }
 
 
-@pytest.fixture
-async def ch_client(clickhouse_config: ChConfig) -> AsyncIterator[AsyncChClient]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def clickhouse_alive(clickhouse_config: ChConfig) -> bool:
+    """Liveness verdict for the whole session: one ping, cached for every test."""
     client = AsyncChClient(**clickhouse_config)
     try:
-        alive = await client.ping(raise_on_error=True)
+        return await client.ping(raise_on_error=True)
     except Exception as e:
         print(f"ClickHouse ping failed with exception: {type(e).__name__}: {e}")  # noqa: T201
-        alive = False
-
-    if not alive:
+        return False
+    finally:
         await client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aiohttp_connector() -> AsyncIterator[TCPConnector]:
+    """Shared connector: the DNS cache and keep-alive sockets outlive any one client."""
+    connector = TCPConnector(limit=0, ttl_dns_cache=300, keepalive_timeout=60)
+    try:
+        yield connector
+    finally:
+        await connector.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def ch_client(
+    clickhouse_config: ChConfig,
+    clickhouse_alive: bool,
+    aiohttp_connector: TCPConnector,
+) -> AsyncIterator[AsyncChClient]:
+    """Shared client for the whole session: one ping check, one connection pool."""
+    if not clickhouse_alive:
         pytest.skip("ClickHouse HTTP service is not available")
 
+    session = ClientSession(connector=aiohttp_connector, connector_owner=False)
+    client = AsyncChClient(**clickhouse_config, session=session)
     try:
         yield client
     finally:
         await client.close()
 
 
+_SchemaKey = tuple[tuple[str, str], ...]
+
+
+@pytest.fixture(scope="session")
+def _table_pool(clickhouse_config: ChConfig) -> Iterator[dict[_SchemaKey, list[str]]]:
+    """Free tables per column schema, reused across tests to skip repeated DDL."""
+    pool: dict[_SchemaKey, list[str]] = {}
+
+    yield pool
+
+    tables = [name for names in pool.values() for name in names]
+    if tables:
+
+        async def _drop() -> None:
+            client = AsyncChClient(**clickhouse_config)
+            try:
+                # Multi-table DROP: one round trip no matter how many tables
+                # the session created.
+                await client.execute(f"DROP TABLE IF EXISTS {', '.join(tables)}")
+            finally:
+                await client.close()
+
+        asyncio.run(_drop())
+
+
 @pytest.fixture
-async def make_table(ch_client: AsyncChClient) -> AsyncIterator[TableFactory]:
-    created: list[str] = []
+async def make_table(ch_client: AsyncChClient, _table_pool: dict[_SchemaKey, list[str]]) -> AsyncIterator[TableFactory]:
+    acquired: list[tuple[_SchemaKey, str]] = []
 
     async def _create(**schema: str) -> str:
-        columns = ", ".join(f"{name} {type_}" for name, type_ in schema.items())
-        table_name = f"test_aiochlite_{uuid4().hex}"
-        await ch_client.execute(f"CREATE TABLE {table_name} ({columns}) ENGINE = Memory")
-        created.append(table_name)
+        key = tuple(schema.items())
+        free = _table_pool.setdefault(key, [])
+        if free:
+            # Reuse a pooled table with the same schema: TRUNCATE is one round
+            # trip instead of the CREATE + DROP pair per test.
+            table_name = free.pop()
+            await ch_client.execute(f"TRUNCATE TABLE {table_name}")
+        else:
+            columns = ", ".join(f"{name} {type_}" for name, type_ in schema.items())
+            table_name = f"{_TABLE_PREFIX}_{next(_table_seq)}"
+            await ch_client.execute(f"CREATE TABLE {table_name} ({columns}) ENGINE = Memory")
+        acquired.append((key, table_name))
         return table_name
 
     try:
         yield _create
     finally:
-        for table_name in created:
-            await ch_client.execute(f"DROP TABLE IF EXISTS {table_name}")
+        for key, table_name in acquired:
+            _table_pool[key].append(table_name)
+
+
+@pytest.fixture
+def make_tables(make_table: TableFactory) -> TablesFactory:
+    """Create several tables at once, overlapping the DDL round trips."""
+
+    async def _create(*schemas: dict[str, str]) -> list[str]:
+        # The HTTP interface runs one statement per request, so the CREATEs
+        # cannot be concatenated; issuing them concurrently amortizes the
+        # round trips the same way.
+        return list(await asyncio.gather(*(make_table(**schema) for schema in schemas)))
+
+    return _create
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
-
 import pytest
+from aiohttp import ClientSession, TCPConnector
 
 from aiochlite import AsyncChClient
 
@@ -19,26 +17,55 @@ _CLIENT_MATRIX = [
 ]
 
 
-@asynccontextmanager
-async def _client(clickhouse_config: ChConfig, **kwargs) -> AsyncIterator[AsyncChClient]:
-    client = AsyncChClient(**clickhouse_config, **kwargs)
-    try:
-        alive = await client.ping()
-        if not alive:
+class _client:  # noqa: N801 - reads as a factory at the call sites
+    """Isolated client context without the asynccontextmanager generator machinery."""
+
+    def __init__(
+        self,
+        clickhouse_config: ChConfig,
+        *,
+        alive: bool,
+        connector: TCPConnector | None = None,
+        **kwargs,
+    ) -> None:
+        self._config = clickhouse_config
+        self._alive = alive
+        self._connector = connector
+        self._kwargs = kwargs
+        self._instance: AsyncChClient | None = None
+
+    async def __aenter__(self) -> AsyncChClient:
+        # `alive` carries the session-wide liveness verdict, so isolated
+        # clients skip without repeating the ping round trip.
+        if not self._alive:
             pytest.skip("ClickHouse HTTP service is not available")
-        yield client
-    finally:
-        await client.close()
+
+        kwargs = self._kwargs
+        if self._connector is not None:
+            # Borrow the session-wide connector so every isolated client
+            # reuses its DNS cache and keep-alive sockets.
+            kwargs["session"] = ClientSession(connector=self._connector, connector_owner=False)
+
+        self._instance = AsyncChClient(**self._config, **kwargs)
+        return self._instance
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self._instance is not None:
+            await self._instance.close()
 
 
 @pytest.mark.parametrize(("enable_compression", "lazy_decode"), _CLIENT_MATRIX)
 async def test_enable_compression_and_lazy_decode(
     clickhouse_config: ChConfig,
+    clickhouse_alive: bool,
+    aiohttp_connector: TCPConnector,
     enable_compression: bool,
     lazy_decode: bool,
 ) -> None:
     async with _client(
         clickhouse_config,
+        alive=clickhouse_alive,
+        connector=aiohttp_connector,
         enable_compression=enable_compression,
         lazy_decode=lazy_decode,
     ) as ch_client:
@@ -51,12 +78,24 @@ async def test_enable_compression_and_lazy_decode(
         assert out == [0, 1]
 
 
-async def test_database_setting(clickhouse_config: ChConfig) -> None:
-    async with _client(clickhouse_config, database="system") as ch_client:
+async def test_database_setting(
+    clickhouse_config: ChConfig,
+    clickhouse_alive: bool,
+    aiohttp_connector: TCPConnector,
+) -> None:
+    async with _client(
+        clickhouse_config,
+        alive=clickhouse_alive,
+        connector=aiohttp_connector,
+        database="system",
+    ) as ch_client:
         assert await ch_client.fetchval("SELECT currentDatabase()") == "system"
 
 
-async def test_custom_session(clickhouse_config: ChConfig) -> None:
+async def test_custom_session(clickhouse_config: ChConfig, clickhouse_alive: bool) -> None:
     aiohttp = pytest.importorskip("aiohttp")
-    async with aiohttp.ClientSession() as session, _client(clickhouse_config, session=session) as ch_client:
+    async with (
+        aiohttp.ClientSession() as session,
+        _client(clickhouse_config, alive=clickhouse_alive, session=session) as ch_client,
+    ):
         assert await ch_client.fetchval("SELECT 1") == 1
@@ -10,7 +10,7 @@ import pytest
 
 from aiochlite import AsyncChClient
 
-from ._types import TableFactory
+from ._types import TableFactory, TablesFactory
 
 pytestmark = [pytest.mark.asyncio, pytest.mark.clickhouse]
 
@@ -25,6 +25,20 @@ async def test_insert_tuple_rows(ch_client: AsyncChClient, make_table: TableFact
     assert [(r["id"], r["name"]) for r in rows] == data
 
 
+async def test_insert_into_tables_created_together(ch_client: AsyncChClient, make_tables: TablesFactory):
+    users, events = await make_tables(
+        {"id": "UInt32", "name": "String"},
+        {"id": "UInt32", "kind": "String"},
+    )
+    assert users != events
+
+    await ch_client.insert(users, [(1, "Alice")], column_names=("id", "name"))
+    await ch_client.insert(events, [(1, "signup"), (1, "login")], column_names=("id", "kind"))
+
+    assert await ch_client.fetchval(f"SELECT name FROM {users}") == "Alice"
+    assert await ch_client.fetchval(f"SELECT count() FROM {events}") == 2
+
+
 async def test_insert_dict_rows_scalar_types(ch_client: AsyncChClient, make_table: TableFactory):
     table = await make_table(
         id="UInt32",
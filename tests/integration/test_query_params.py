@@ -13,6 +13,48 @@ from aiochlite import AsyncChClient
 
 pytestmark = [pytest.mark.asyncio, pytest.mark.clickhouse]
 
+# Immutable payloads built once at import instead of per test run.
+_UID = UUID("550e8400-e29b-41d4-a716-446655440000")
+_DT = datetime(2025, 12, 14, 10, 0, 0, tzinfo=ZoneInfo("UTC"))
+_D = date(2025, 12, 14)
+_IP4 = ipaddress.IPv4Address("1.2.3.4")
+_IP6 = ipaddress.IPv6Address("2001:db8::1")
+
+_SCALAR_PARAMS: dict[str, Any] = {
+    "bt": True,
+    "bf": False,
+    "u8": 5,
+    "i32": -42,
+    "f64": 3.5,
+    "s": "hi",
+    "bs": b"hello",
+    "d": _D,
+    "dt": _DT,
+    "uid": _UID,
+    "ip4": _IP4,
+    "ip6": _IP6,
+    "dec": Decimal("123.45"),
+    "ns": None,
+    "ni": None,
+}
+
+_ARR_S = ["a", "x\\y", "quote:'", "line\nbreak"]
+_MP: dict[str, Any] = {"k": 1, "x\\y": -2, "quote:'": 3}
+_MP_NESTED = {"a": [1, 2], "b": []}
+
+_CONTAINER_PARAMS: dict[str, Any] = {
+    "arr_u8": [1, 2, 3],
+    "arr_ns": [None, "x", None],
+    "arr_ni": [None, 1, None, -2],
+    "arr_s": _ARR_S,
+    "tup": ("meta", 7),
+    "tup_n": ("q", None),
+    "mp": _MP,
+    "mp_n": {"a": None, "b": 2, "c": None},
+    "mp_arr_n": {"a": [None, 1, None], "b": []},
+    "mp_nested": _MP_NESTED,
+}
+
 
 async def test_settings_are_applied(ch_client: AsyncChClient):
     value = await ch_client.fetchval(
@@ -23,12 +65,6 @@ async def test_settings_are_applied(ch_client: AsyncChClient):
 
 
 async def test_params_scalar_types(ch_client: AsyncChClient):
-    uid = UUID("550e8400-e29b-41d4-a716-446655440000")
-    dt = datetime(2025, 12, 14, 10, 0, 0, tzinfo=ZoneInfo("UTC"))
-    d = date(2025, 12, 14)
-    ip4 = ipaddress.IPv4Address("1.2.3.4")
-    ip6 = ipaddress.IPv6Address("2001:db8::1")
-
     row = await ch_client.fetchone(
         """
         SELECT
@@ -48,23 +84,7 @@ async def test_params_scalar_types(ch_client: AsyncChClient):
             {ns:Nullable(String)} AS ns,
             {ni:Nullable(Int32)} AS ni
         """,
-        params={
-            "bt": True,
-            "bf": False,
-            "u8": 5,
-            "i32": -42,
-            "f64": 3.5,
-            "s": "hi",
-            "bs": b"hello",
-            "d": d,
-            "dt": dt,
-            "uid": uid,
-            "ip4": ip4,
-            "ip6": ip6,
-            "dec": Decimal("123.45"),
-            "ns": None,
-            "ni": None,
-        },
+        params=_SCALAR_PARAMS,
     )
     assert row is not None
 
@@ -75,21 +95,17 @@ async def test_params_scalar_types(ch_client: AsyncChClient):
     assert row["f64"] == pytest.approx(3.5)
     assert row["s"] == "hi"
     assert row["bs"] == "hello"
-    assert row["d"] == d
-    assert row["dt"] == dt
-    assert row["uid"] == uid
-    assert row["ip4"] == ip4
-    assert row["ip6"] == ip6
+    assert row["d"] == _D
+    assert row["dt"] == _DT
+    assert row["uid"] == _UID
+    assert row["ip4"] == _IP4
+    assert row["ip6"] == _IP6
     assert row["dec"] == Decimal("123.45")
     assert row["ns"] is None
     assert row["ni"] is None
 
 
 async def test_params_container_types(ch_client: AsyncChClient):
-    arr_s = ["a", "x\\y", "quote:'", "line\nbreak"]
-    mp: dict[str, Any] = {"k": 1, "x\\y": -2, "quote:'": 3}
-    mp_nested = {"a": [1, 2], "b": []}
-
     row = await ch_client.fetchone(
         """
         SELECT
@@ -104,27 +120,16 @@ async def test_params_container_types(ch_client: AsyncChClient):
             {mp_arr_n:Map(String, Array(Nullable(Int32)))} AS mp_arr_n,
             {mp_nested:Map(String, Array(Int32))} AS mp_nested
         """,
-        params={
-            "arr_u8": [1, 2, 3],
-            "arr_ns": [None, "x", None],
-            "arr_ni": [None, 1, None, -2],
-            "arr_s": arr_s,
-            "tup": ("meta", 7),
-            "tup_n": ("q", None),
-            "mp": mp,
-            "mp_n": {"a": None, "b": 2, "c": None},
-            "mp_arr_n": {"a": [None, 1, None], "b": []},
-            "mp_nested": mp_nested,
-        },
+        params=_CONTAINER_PARAMS,
     )
     assert row is not None
     assert row["arr_u8"] == [1, 2, 3]
     assert row["arr_ns"] == [None, "x", None]
     assert row["arr_ni"] == [None, 1, None, -2]
-    assert row["arr_s"] == arr_s
+    assert row["arr_s"] == _ARR_S
     assert row["tup"] == ("meta", 7)
     assert row["tup_n"] == ("q", None)
-    assert row["mp"] == mp
+    assert row["mp"] == _MP
     assert row["mp_n"] == {"a": None, "b": 2, "c": None}
     assert row["mp_arr_n"] == {"a": [None, 1, None], "b": []}
-    assert row["mp_nested"] == mp_nested
+    assert row["mp_nested"] == _MP_NESTED